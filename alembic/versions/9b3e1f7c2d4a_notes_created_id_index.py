@@ -0,0 +1,33 @@
+"""notes created_at/id index
+
+Revision ID: 9b3e1f7c2d4a
+Revises: 4c201ab4a943
+Create Date: 2026-10-14 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e1f7c2d4a'
+down_revision: str | Sequence[str] | None = '4c201ab4a943'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_notes_created_id_desc',
+        'notes',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notes_created_id_desc', table_name='notes')
@@ -1,32 +1,81 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, desc, insert, tuple_, update
+from sqlalchemy.orm import Session, raiseload
 from sqlmodel import select
 
 from app.models import Note
 
+__all__ = [
+    "bulk_insert_notes",
+    "create_note",
+    "delete_note",
+    "get_note",
+    "iter_all_notes",
+    "list_notes",
+    "update_note",
+]
+
+_NOTES_TABLE = Note.__table__  # type: ignore[attr-defined]
+
+# Newest-first listing query, built once at import and reused by every list
+# and export call. Order by created_at desc, then id desc for deterministic ties.
+# raiseload("*") makes any future relationship touched while serializing a page
+# fail loudly instead of lazy-loading one query per row; eager-load explicitly.
+_LIST_STMT = (
+    select(Note)
+    .options(raiseload("*"))
+    .order_by(
+        desc(Note.created_at),  # type: ignore[arg-type]
+        desc(Note.id),  # type: ignore[arg-type]
+    )
+)
+
+# Export variant of the listing query, streamed in fixed-size batches
+_EXPORT_STMT = _LIST_STMT.execution_options(yield_per=1000)
+
 
 def create_note(
     db: Session, *, title: str, content: str = "", tags: Optional[List[str]] = None
 ) -> Note:
-    note = Note(title=title, content=content or "", tags=tags or [])
-    db.add(note)
+    content = content or ""
+    tags = tags or []
+    # RETURNING hands back the server-generated columns in the INSERT round-trip,
+    # so there is no follow-up SELECT to refresh the instance
+    stmt = (
+        insert(Note)
+        .values(title=title, content=content, tags=tags)
+        .returning(Note.id, Note.created_at, Note.updated_at)  # type: ignore[call-overload]
+    )
+    row = db.execute(stmt).one()
     db.commit()
-    db.refresh(note)
-    return note
+    return Note(
+        id=row.id,
+        title=title,
+        content=content,
+        tags=tags,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
 
 
-def list_notes(db: Session) -> list[Note]:
-    # Order by created_at desc, then id desc for deterministic ties
-    stmt = select(Note).order_by(
-        desc(Note.created_at),  # type: ignore[arg-type]
-        desc(Note.id),  # type: ignore[arg-type]
-    )
-    return list(db.execute(stmt).scalars().all())
+def list_notes(db: Session, *, limit: int = 50, after: Optional[int] = None) -> list[Note]:
+    """Return up to ``limit`` notes, newest first, starting after note ``after``.
+
+    Keyset pagination: the cursor is the id of the last note on the previous
+    page, and its (created_at, id) sort key is looked up in a subquery so rows
+    are compared against the stored value exactly. If that note has since been
+    deleted the page is empty.
+    """
+    stmt = _LIST_STMT
+    if after is not None:
+        anchor = select(Note.created_at).where(Note.id == after).scalar_subquery()
+        stmt = stmt.where(tuple_(Note.created_at, Note.id) < tuple_(anchor, after))
+    return list(db.execute(stmt.limit(limit)).scalars().all())
 
 
 def get_note(db: Session, note_id: int) -> Optional[Note]:
@@ -41,58 +90,72 @@ def update_note(
     content: Optional[str] = None,
     tags: Optional[List[str]] = None,
 ) -> Optional[Note]:
-    note = db.get(Note, note_id)
-    if not note:
-        return None
+    values: dict[str, object] = {"updated_at": datetime.now(timezone.utc)}
     if title is not None:
-        note.title = title
+        values["title"] = title
     if content is not None:
-        note.content = content
+        values["content"] = content
     if tags is not None:
-        note.tags = tags
-    note.updated_at = datetime.now(timezone.utc)
-    db.add(note)
+        values["tags"] = tags
+    # One UPDATE ... RETURNING both applies the change and reads the row back,
+    # replacing the lookup SELECT and the post-commit refresh SELECT
+    stmt = (
+        update(Note)
+        .where(Note.id == note_id)  # type: ignore[arg-type]
+        .values(**values)
+        .returning(Note)
+    )
+    note = db.execute(stmt).scalar_one_or_none()
+    if note is None:
+        db.rollback()
+        return None
+    # Detach before commit so the freshly returned attributes are not expired
+    db.expunge(note)
     db.commit()
-    db.refresh(note)
     return note
 
 
 def delete_note(db: Session, note_id: int) -> bool:
-    note = db.get(Note, note_id)
-    if not note:
-        return False
-    db.delete(note)
+    # A bare DELETE skips loading the row into the session just to remove it
+    result = db.execute(delete(Note).where(Note.id == note_id))  # type: ignore[arg-type]
     db.commit()
-    return True
-
-
-from collections.abc import Iterable
-
-
-def iter_all_notes(db: Session) -> Iterable[Note]:
-    """Yield all notes ordered newest-first (created_at desc, id desc)."""
-    stmt = select(Note).order_by(
-        desc(Note.created_at),  # type: ignore[arg-type]
-        desc(Note.id),  # type: ignore[arg-type]
-    )
-    for note in db.execute(stmt).scalars():
-        yield note
-
-
-def bulk_insert_notes(db: Session, items: list[dict]) -> int:
-    """Insert many notes in one transaction. Returns inserted count."""
-    notes: list[Note] = []
-    for data in items:
-        notes.append(
-            Note(
-                title=data["title"],
-                content=data.get("content", ""),
-                tags=data.get("tags", []),
-                created_at=data.get("created_at", datetime.now(timezone.utc)),
-                updated_at=data.get("updated_at", data.get("created_at", datetime.now(timezone.utc))),
-            )
-        )
-    if notes:
-        db.add_all(notes)
-        db.commit()
-    return len(notes)
+    return result.rowcount > 0  # type: ignore[attr-defined]
+
+
+def iter_all_notes(db: Session) -> Iterator[Note]:
+    """Yield all notes ordered newest-first (created_at desc, id desc).
+
+    Rows are fetched and hydrated 1000 at a time (yield_per implies
+    stream_results, so the DBAPI cursor is read incrementally), keeping memory
+    bounded by the batch size rather than the table size. The session's
+    identity map is weak-referencing, so notes the caller has finished with are
+    released without an explicit expunge.
+    """
+    yield from db.execute(_EXPORT_STMT).scalars()
+
+
+def bulk_insert_notes(db: Session, items: list[dict]) -> list[int]:
+    """Insert many notes in one transaction. Returns the inserted ids.
+
+    Uses a single Core executemany INSERT against the table (batched via
+    insertmanyvalues), bypassing both ORM instances and the ORM bulk-insert
+    layer, so large imports stay off the unit-of-work path. Ids come back via
+    RETURNING, so callers never need a SELECT per row.
+    """
+    now = datetime.now(timezone.utc)
+    payload = [
+        {
+            "title": data["title"],
+            "content": data.get("content", ""),
+            "tags": data.get("tags", []),
+            "created_at": data.get("created_at", now),
+            "updated_at": data.get("updated_at", data.get("created_at", now)),
+        }
+        for data in items
+    ]
+    if not payload:
+        return []
+    stmt = insert(_NOTES_TABLE).returning(_NOTES_TABLE.c.id)
+    ids = list(db.execute(stmt, payload).scalars().all())
+    db.commit()
+    return ids
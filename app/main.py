@@ -3,7 +3,8 @@ import logging
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import RedirectResponse, Response
+from pydantic_core import to_json
 
 from app.db import db_ready
 from app.routes import router
@@ -16,7 +17,7 @@ from app.settings import (
 )
 
 tags_metadata = [
-    {"name": "Notes", "description": "CRUD over notes."},
+    {"name": "Notes", "description": "CRUD over notes. Use `POST /notes/batch` for bulk ingestion."},
     {"name": "Health", "description": "Liveness and readiness."},
     {"name": "Meta", "description": "Service metadata."},
 ]
@@ -45,48 +46,65 @@ app = FastAPI(
 
 
 @app.get("/", include_in_schema=False)
-def root_redirect() -> RedirectResponse:
+async def root_redirect() -> RedirectResponse:
     return RedirectResponse(url="/docs")
 
 
+# Probe bodies never change, so they are encoded once at import. Endpoints
+# that do no I/O are async so they run on the event loop without a threadpool hop
+_HEALTH_BYTES = b'{"status":"ok"}'
+_READY_BYTES = b'{"status":"ready"}'
+_NOT_READY_BYTES = b'{"detail":"database unavailable","code":"service-unavailable"}'
+
+
 @app.get("/health", tags=["Health"])
-def health() -> dict:
-    return {"status": "ok"}
+async def health() -> Response:
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 # Include application routes
 app.include_router(router)
 
 
+# Machine codes for every known status, computed once instead of per error
+_CODE_MAP: dict[int, str] = {s.value: s.phrase.lower().replace(" ", "-") for s in HTTPStatus}
+_CODE_MAP[404] = "not_found"
+
+
 def _status_code_to_machine_code(status_code: int) -> str:
-    if status_code == 404:
-        return "not_found"
-    try:
-        phrase = HTTPStatus(status_code).phrase
-        return phrase.lower().replace(" ", "-")
-    except Exception:
-        return "error"
+    return _CODE_MAP.get(status_code, "error")
+
+
+def _error_response(status_code: int, msg: str, code: str) -> Response:
+    # Same body shape as ErrorResponse, encoded by pydantic-core rather than stdlib json
+    return Response(
+        content=to_json({"detail": msg, "code": code}),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
+# Handlers stay async: Starlette awaits coroutine handlers inline but runs
+# plain functions through the threadpool, which would add a hop per error
 @app.exception_handler(HTTPException)
-async def http_exception_handler(_: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(_: Request, exc: HTTPException) -> Response:
     detail = exc.detail
     if isinstance(detail, dict) and "detail" in detail:
         msg = str(detail.get("detail"))
     else:
         msg = str(detail)
     code = _status_code_to_machine_code(exc.status_code)
-    return JSONResponse(status_code=exc.status_code, content={"detail": msg, "code": code})
+    return _error_response(exc.status_code, msg, code)
 
 
 @app.exception_handler(RequestValidationError)
-async def validation_exception_handler(_: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(_: Request, exc: RequestValidationError) -> Response:
     errors = exc.errors() or []
     msg = errors[0].get("msg") if errors else "validation error"
-    return JSONResponse(status_code=422, content={"detail": msg, "code": "validation_error"})
+    return _error_response(422, msg, "validation_error")
 
 
 @app.get("/ready", tags=["Health"])
-def ready() -> JSONResponse:
+def ready() -> Response:
     if db_ready():
-        return JSONResponse(status_code=200, content={"status": "ready"})
-    return JSONResponse(status_code=503, content={"detail": "database unavailable", "code": "service-unavailable"})
+        return Response(content=_READY_BYTES, media_type="application/json")
+    return Response(content=_NOT_READY_BYTES, status_code=503, media_type="application/json")
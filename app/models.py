@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func
 from sqlalchemy.types import JSON
 from sqlmodel import Field, SQLModel
 
@@ -23,3 +23,8 @@ class Note(SQLModel, table=True):
             DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
         )
     )
+
+
+# Matches the list/export sort order so SQLite can walk the index instead of
+# sorting the whole table on every request
+Index("ix_notes_created_id_desc", Note.created_at.desc(), Note.id.desc())  # type: ignore[attr-defined, union-attr]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ErrorResponse(BaseModel):
@@ -71,6 +71,41 @@ class ListNotesResponse(BaseModel):
     items: list[NoteRead] = Field(
         default_factory=list, description="Newest-first list of notes."
     )
+    next_after: Optional[int] = Field(
+        default=None,
+        description="Pass as `after` to fetch the next page; null on the last page.",
+        examples=[None],
+    )
+
+
+class InsertedResponse(BaseModel):
+    inserted: int = Field(..., description="Number of notes inserted.", examples=[2])
+
+
+class ImportRow(BaseModel):
+    """One JSON Lines record accepted by ``POST /notes/import``.
+
+    Strict, so values are never coerced (e.g. a numeric title is rejected).
+    Unknown keys such as ``id`` from an export are ignored.
+    """
+
+    model_config = ConfigDict(strict=True)
+
+    title: str = Field(..., min_length=1, max_length=100)
+    content: str = ""
+    tags: list[str] = Field(default_factory=list)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @field_validator("created_at", "updated_at", mode="before")
+    @classmethod
+    def _parse_iso(cls, value: object) -> object:
+        # Strict pydantic parsing rejects forms fromisoformat has always
+        # accepted here, such as "2024-01-01" or "20240101T100000". On 3.11+
+        # fromisoformat also takes a trailing "Z" as-is
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return value
 
 
 class OpenAPIExamples:
@@ -116,7 +151,8 @@ class OpenAPIExamples:
                         "created_at": "2024-01-01T00:00:00Z",
                         "updated_at": "2024-01-01T00:00:00Z",
                     },
-                ]
+                ],
+                "next_after": None,
             },
         }
     }
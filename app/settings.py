@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -19,6 +20,23 @@ class Settings(BaseSettings):
     APP_NAME: str = "Notes API"
     ENV: str = "dev"
     ENABLE_FTS: bool = False  # placeholder, unused
+    POOL_SIZE: int = 30
+    POOL_MAX_OVERFLOW: int = 10
+    POOL_RECYCLE: int = 3600  # seconds
+
+
+# (name, default, type) for every Settings field. Defaults mirror the class
+# defaults above; frozen at import so the fallback reader only loops over it
+_FIELDS: tuple[tuple[str, Any, type], ...] = (
+    ("DATABASE_URL", "sqlite:///./data/app.db", str),
+    ("LOG_LEVEL", "INFO", str),
+    ("APP_NAME", "Notes API", str),
+    ("ENV", "dev", str),
+    ("ENABLE_FTS", False, bool),
+    ("POOL_SIZE", 30, int),
+    ("POOL_MAX_OVERFLOW", 10, int),
+    ("POOL_RECYCLE", 3600, int),
+)
 
 
 def _env_overrides() -> dict[str, Any]:
@@ -26,31 +44,24 @@ def _env_overrides() -> dict[str, Any]:
 
     Only reads known fields and performs simple type coercion.
     """
-    def _get_bool(name: str, default: bool) -> bool:
+    overrides: dict[str, Any] = {}
+    for name, default, kind in _FIELDS:
         raw = os.getenv(name)
         if raw is None:
-            return default
-        return raw.strip().lower() in {"1", "true", "yes", "on"}
-
-    # Defaults mirror the dataclass defaults above
-    defaults: dict[str, Any] = {
-        "DATABASE_URL": "sqlite:///./data/app.db",
-        "LOG_LEVEL": "INFO",
-        "APP_NAME": "Notes API",
-        "ENV": "dev",
-        "ENABLE_FTS": False,
-    }
-
-    overrides: dict[str, Any] = {}
-    for key, default in defaults.items():
-        if isinstance(default, bool):
-            overrides[key] = _get_bool(key, default)
+            overrides[name] = default
+        elif kind is bool:
+            overrides[name] = raw.strip().lower() in {"1", "true", "yes", "on"}
         else:
-            overrides[key] = os.getenv(key, default)
+            overrides[name] = raw
     return overrides
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Return the process-wide settings, read from the environment once.
+
+    Call ``get_settings.cache_clear()`` after changing env vars (e.g. in tests).
+    """
     # If pydantic-settings is available, let it handle env parsing
     if _HAS_PYDANTIC_SETTINGS:
         return Settings()
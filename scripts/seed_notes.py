@@ -9,7 +9,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterable, Sequence
 
-from sqlalchemy import text, inspect
+from sqlalchemy import insert, text, inspect
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.engine import Engine
 from sqlmodel import SQLModel, create_engine
@@ -50,23 +50,27 @@ def build_engine(db_url: str, allow_app_engine: bool) -> Engine:
 
 
 def ensure_schema(engine: Engine, db_url: str) -> None:
-    insp = inspect(engine)
-    if insp.has_table("notes"):
+    # Each inspect() is a fresh Inspector, so only re-inspect after something
+    # may have changed the schema
+    if inspect(engine).has_table("notes"):
         return  # already good
 
     # Try Alembic against the SAME DB
     try:
         env = os.environ.copy()
         env["DATABASE_URL"] = db_url
-        repo_root = pathlib.Path(__file__).resolve().parents[1]  # project root
-        subprocess.run(["alembic", "upgrade", "head"], check=True, cwd=str(repo_root), env=env)
+        repo_root = Path(__file__).resolve().parents[1]  # project root
+        subprocess.run(
+            ["alembic", "upgrade", "head"], check=True, cwd=str(repo_root), env=env, capture_output=True
+        )
     except Exception:
         pass
 
     # If still missing, fall back to create_all on this engine
-    if not inspect(engine).has_table("notes"):
-        from app import models as _models  # ensure models registered
-        SQLModel.metadata.create_all(engine)
+    if inspect(engine).has_table("notes"):
+        return
+    from app import models as _models  # ensure models registered
+    SQLModel.metadata.create_all(engine)
 
     # Final guard
     if not inspect(engine).has_table("notes"):
@@ -80,11 +84,10 @@ def reset_notes(session: Session) -> int:
     except Exception:
         count = 0
     session.execute(text("DELETE FROM notes"))
-    session.commit()
     return int(count or 0)
 
 
-WORDS = [
+WORDS = (
     "alpha",
     "bravo",
     "charlie",
@@ -124,9 +127,9 @@ WORDS = [
     "draft",
     "project",
     "reading",
-]
+)
 
-TAGS_POOL = [
+TAGS_POOL = (
     "work",
     "personal",
     "ideas",
@@ -137,72 +140,81 @@ TAGS_POOL = [
     "reading",
     "project",
     "journal",
-]
+)
+
+# One generator for the whole run; seed it via --seed for reproducible data
+_RNG = random.Random()
 
 
 def rand_words(n: int) -> list[str]:
-    return random.sample(WORDS, k=min(n, len(WORDS)))
+    return _RNG.sample(WORDS, k=min(n, len(WORDS)))
 
 
 def gen_title() -> str:
-    parts = rand_words(random.randint(3, 8))
+    parts = rand_words(_RNG.randint(3, 8))
     title = " ".join(w.capitalize() for w in parts)
     if len(title) > 100:
         title = title[:100].rstrip()
     return title
 
 
-def gen_sentence() -> str:
-    n = random.randint(12, 20)
-    words = random.choices(WORDS, k=n)
+def gen_content() -> str:
+    # One draw and one join per note (24-80 words, same range as 2-4 sentences)
+    words = _RNG.choices(WORDS, k=_RNG.randint(24, 80))
     words[0] = words[0].capitalize()
     return " ".join(words) + "."
 
 
-def gen_content() -> str:
-    s_count = random.randint(2, 4)
-    return " ".join(gen_sentence() for _ in range(s_count))
-
-
 def gen_tags() -> list[str]:
-    k = random.randint(0, 3)
-    return random.sample(TAGS_POOL, k=k)
+    k = _RNG.randint(0, 3)
+    return _RNG.sample(TAGS_POOL, k=k)
+
 
+def rand_datetimes(count: int, days_back: int) -> list[tuple[datetime, datetime]]:
+    """Draw ``count`` (created, updated) pairs in one pass.
 
-def rand_datetimes(days_back: int) -> tuple[datetime, datetime]:
+    The clock is read once per batch and each timestamp is a single offset in
+    seconds, so a note costs two or three RNG calls instead of four.
+    """
     now = datetime.now(timezone.utc)
-    back_days = random.randint(0, max(0, days_back))
-    back_seconds = random.randint(0, 86400)
-    created = now - timedelta(days=back_days, seconds=back_seconds)
-    if random.random() < 0.5:
-        updated = created
-    else:
-        delta_sec = int((now - created).total_seconds())
-        updated = created + timedelta(seconds=random.randint(0, max(0, delta_sec)))
-    return created, updated
+    span = max(0, days_back) * 86400 + 86400
+    randint, random_ = _RNG.randint, _RNG.random
+    pairs: list[tuple[datetime, datetime]] = []
+    for _ in range(count):
+        back = randint(0, span)
+        created = now - timedelta(seconds=back)
+        if random_() < 0.5:
+            updated = created
+        else:
+            updated = created + timedelta(seconds=randint(0, back))
+        pairs.append((created, updated))
+    return pairs
 
 
 def seed_notes(session: Session, count: int, days_back: int) -> int:
     from app.models import Note
 
-    notes: list[Note] = []
-    for _ in range(count):
-        title = gen_title()
-        content = gen_content()
-        tags = gen_tags()
-        created_at, updated_at = rand_datetimes(days_back)
-        notes.append(
-            Note(
-                title=title,
-                content=content,
-                tags=tags,
-                created_at=created_at,
-                updated_at=updated_at,
-            )
+    # Plain dicts through a Core executemany, the same statement as
+    # crud.bulk_insert_notes minus its commit; the caller owns the transaction.
+    # Tags are encoded by the JSON column. RETURNING looks unnecessary here, but
+    # dropping it is slower on SQLite: without RETURNING the dialect falls back to
+    # cursor.executemany, one statement per row, instead of batching rows into
+    # multi-VALUES statements via insertmanyvalues.
+    rows: list[dict] = []
+    for created_at, updated_at in rand_datetimes(count, days_back):
+        rows.append(
+            {
+                "title": gen_title(),
+                "content": gen_content(),
+                "tags": gen_tags(),
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
         )
-    session.add_all(notes)
-    session.commit()
-    return len(notes)
+    if not rows:
+        return 0
+    table = Note.__table__
+    return len(session.execute(insert(table).returning(table.c.id), rows).all())
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -221,11 +233,14 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Override database URL (default: env DATABASE_URL or sqlite:///./data/app.db)",
     )
+    p.add_argument("--seed", type=int, default=None, help="Random seed for reproducible data")
     return p.parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> None:
     args = parse_args(argv)
+    if args.seed is not None:
+        _RNG.seed(args.seed)
     db_url = resolve_db_url(args.db_url)
     ensure_sqlite_dir(db_url)
     engine = build_engine(db_url, allow_app_engine=(args.db_url is None))
@@ -234,7 +249,9 @@ def main(argv: Sequence[str] | None = None) -> None:
     ensure_schema(engine, db_url)
 
     deleted = 0
-    with SessionLocal() as session:
+    # Reset and seed in one transaction: a single commit, and a failed seed
+    # leaves the existing notes untouched
+    with SessionLocal() as session, session.begin():
         if args.reset:
             deleted = reset_notes(session)
         inserted = seed_notes(session, count=args.count, days_back=args.days_back)
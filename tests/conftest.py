@@ -1,17 +1,18 @@
 import os
-import sys
+import sqlite3
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from pydantic_core import from_json
+from sqlalchemy import event, make_url
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, create_engine
 
-# Ensure project root on path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from app.db import get_session  # noqa: E402
-from app.main import app as fastapi_app  # noqa: E402
+from app import db as app_db
+from app import models  # noqa: F401  (registers tables on SQLModel.metadata)
+from app.db import get_session
+from app.main import app as fastapi_app
 
 
 @pytest.fixture
@@ -19,25 +20,134 @@ def app():
     return fastapi_app
 
 
-@pytest.fixture
-def db_override(app):
-    engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
-    )
-    # Import models so tables are registered
-    from app import models as _models  # noqa: F401
+def _engine_url():
+    # Override only to debug against a file DB; see the guard in engine()
+    return os.environ.get("NOTES_TEST_DB", "sqlite:///:memory:")
+
+
+@pytest.fixture(scope="session")
+def engine():
+    # One in-memory database and schema for the whole run; tests are isolated by
+    # rolling back a per-test transaction instead of rebuilding tables. A plain
+    # :memory: DB is private to its process, so parallel runners that fork one
+    # process per worker (pytest-xdist) each get their own without a named URI.
+    #
+    # The single physical connection is opened and configured here and handed
+    # out by StaticPool on every checkout. isolation_level=None disables
+    # pysqlite's own transaction handling, which breaks SAVEPOINT. Nothing
+    # contends for the DB, so there is no busy wait (sqlite3 defaults to 5s) and
+    # no durability work.
+    database = make_url(_engine_url()).database or ":memory:"
+    if database != ":memory:" and not os.environ.get("NOTES_TEST_DB_ALLOW_FILE"):
+        pytest.fail(
+            f"NOTES_TEST_DB points at a file ({database}); the suite runs on :memory:. "
+            "Set NOTES_TEST_DB_ALLOW_FILE=1 to opt in deliberately.",
+            pytrace=False,
+        )
+    raw = sqlite3.connect(database, check_same_thread=False, isolation_level=None)
+    raw.execute("PRAGMA busy_timeout=0")
+    raw.execute("PRAGMA journal_mode=MEMORY")
+    raw.execute("PRAGMA synchronous=OFF")
+    engine = create_engine("sqlite://", creator=lambda: raw, poolclass=StaticPool)
+
+    # With pysqlite's handling off, SQLAlchemy emits BEGIN itself
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+    raw.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _app_engine():
+    # Code that reaches app.db directly (db_ready, SessionLocal) would otherwise
+    # open the file-backed ./data/app.db from Settings.DATABASE_URL. It gets its
+    # own :memory: engine rather than the test one: a second checkout of that
+    # single connection would roll back the outer transaction of db_rw on return.
+    file_engine = app_db.engine
+    memory_engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    app_db.engine = memory_engine
+    app_db.SessionLocal.configure(bind=memory_engine)
+    yield
+    app_db.SessionLocal.configure(bind=file_engine)
+    app_db.engine = file_engine
+    memory_engine.dispose()
+
 
-    def _get_session_override():
-        with Session(engine) as session:
-            yield session
+def _serve_session(app, session):
+    # Async so FastAPI resolves it on the event loop; a sync generator
+    # dependency is entered and exited through the threadpool on every request.
+    # Yielding does no I/O, and the session is closed by the owning fixture
+    async def _get_session_override():
+        yield session
 
     app.dependency_overrides[get_session] = _get_session_override
+
+
+@pytest.fixture
+def db_rw(app, engine):
+    # Join one session into an outer transaction: commits inside the app only
+    # release a SAVEPOINT, and the rollback at teardown discards everything the
+    # test wrote, so no test sees another's rows
+    connection = engine.connect()
+    trans = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    _serve_session(app, session)
+    try:
+        yield session
+    finally:
+        app.dependency_overrides.clear()
+        session.close()
+        trans.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def db_ro(app, engine):
+    # For tests marked readonly: a plain session with no outer transaction or
+    # per-request SAVEPOINTs. query_only makes any write fail loudly instead of
+    # leaking rows into later tests
+    session = Session(engine)
+    session.connection().exec_driver_sql("PRAGMA query_only=ON")
+    _serve_session(app, session)
     try:
-        yield
+        yield session
     finally:
         app.dependency_overrides.clear()
+        session.connection().exec_driver_sql("PRAGMA query_only=OFF")
+        session.close()
+
+
+@pytest.fixture
+def db_override(request):
+    name = "db_ro" if request.node.get_closest_marker("readonly") else "db_rw"
+    return request.getfixturevalue(name)
+
+
+@pytest.fixture
+def db(db_override):
+    # The session requests are served from, for seeding and inspecting rows
+    return db_override
+
+
+@pytest.fixture
+def json_of():
+    # Parse a response body with pydantic-core (Rust) rather than stdlib json
+    def _json_of(resp):
+        return from_json(resp.content)
+
+    return _json_of
+
+
+@pytest.fixture
+def json_headers():
+    # Headers for posting a body pre-serialized with to_json as raw content
+    return {"content-type": "application/json"}
 
 
 @pytest.fixture
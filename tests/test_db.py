@@ -0,0 +1,26 @@
+import pytest
+from sqlalchemy import make_url
+from sqlalchemy.pool import StaticPool
+from sqlmodel import create_engine
+
+from app import db
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["sqlite://", "sqlite:///:memory:", "sqlite:///file::memory:?cache=shared&uri=true"],
+)
+def test_in_memory_sqlite_urls_use_static_pool(url):
+    engine = create_engine(url, **db._pool_kwargs(make_url(url)))
+    try:
+        assert isinstance(engine.pool, StaticPool)
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("SELECT 1").scalar() == 1
+    finally:
+        engine.dispose()
+
+
+def test_file_sqlite_url_gets_sized_pool():
+    kwargs = db._pool_kwargs(make_url("sqlite:///./data/app.db"))
+    assert kwargs["max_overflow"] == db.settings.POOL_MAX_OVERFLOW
+    assert "poolclass" not in kwargs
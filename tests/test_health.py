@@ -1,15 +1,32 @@
-import os
-import sys
+import pytest
 
-from fastapi.testclient import TestClient
 
-# Ensure project root is on sys.path for `import app`
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from app.main import app
+@pytest.mark.anyio
+@pytest.mark.readonly
+async def test_health_ok(async_client, json_of):
+    resp = await async_client.get("/health")
+    assert resp.status_code == 200
+    assert json_of(resp) == {"status": "ok"}
 
 
-def test_health_ok():
-    client = TestClient(app)
-    resp = client.get("/health")
-    assert resp.status_code == 200
-    assert resp.json() == {"status": "ok"}
+def test_ready_check_is_cached(monkeypatch, engine):
+    from sqlalchemy import event
+
+    from app import db
+
+    monkeypatch.setattr(db, "engine", engine)
+    monkeypatch.setattr(db, "_ready_ok_at", None)
+    pings = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        # The test engine emits its own BEGIN; only the probe itself counts
+        if statement == "SELECT 1":
+            pings.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        assert db.db_ready() is True
+        assert db.db_ready() is True
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    assert len(pings) == 1
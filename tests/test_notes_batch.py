@@ -0,0 +1,26 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_batch_create_inserts_all(async_client, json_of):
+    resp = await async_client.post(
+        "/notes/batch",
+        json=[{"title": "a"}, {"title": "b", "content": "2", "tags": ["x"]}],
+    )
+    assert resp.status_code == 201
+    assert json_of(resp) == {"inserted": 2}
+
+    items = json_of(await async_client.get("/notes"))["items"]
+    by_title = {i["title"]: i for i in items}
+    assert set(by_title) == {"a", "b"}
+    assert by_title["a"]["content"] == ""
+    assert by_title["b"]["tags"] == ["x"]
+
+
+async def test_batch_create_invalid_item_inserts_nothing(async_client, json_of):
+    resp = await async_client.post("/notes/batch", json=[{"title": "ok"}, {"title": "x" * 101}])
+    assert resp.status_code == 422
+    assert json_of(resp).get("code") == "validation_error"
+
+    assert json_of(await async_client.get("/notes"))["items"] == []
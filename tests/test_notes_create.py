@@ -1,51 +1,34 @@
-import os
-import sys
-
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
-from sqlalchemy.pool import StaticPool
-from sqlmodel import SQLModel, create_engine
-
-# Ensure project root on path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from app.db import get_session  # noqa: E402
-from app.main import app  # noqa: E402
+from pydantic_core import to_json
 
+from app.models import Note
 
-@pytest.fixture(autouse=True)
-def override_db_dependency():
-    engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
-    )
-    # Import models to ensure tables are registered
-    from app import models as _models  # noqa: F401
+pytestmark = pytest.mark.anyio
 
-    SQLModel.metadata.create_all(engine)
+# One over the 100-char limit shared by NoteCreate and NoteUpdate
+LONG_TITLE = "x" * 101
 
-    def _get_session_override():
-        with Session(engine) as session:
-            yield session
+# Request bodies serialized once at import and sent as raw content
+MINIMAL = to_json({"title": "t", "content": "c"})
+LONG_TITLE_BODY = to_json({"title": LONG_TITLE})
 
-    app.dependency_overrides[get_session] = _get_session_override
-    yield
-    app.dependency_overrides.clear()
 
-
-def test_create_note_minimal():
-    client = TestClient(app)
-    resp = client.post("/notes", json={"title": "t", "content": "c"})
+async def test_create_note_minimal(async_client, json_of, json_headers):
+    resp = await async_client.post("/notes", content=MINIMAL, headers=json_headers)
     assert resp.status_code == 201
-    data = resp.json()
-    assert isinstance(data.get("id"), int)
-    assert data["title"] == "t"
-    assert data["content"] == "c"
-    assert data["tags"] == []
+    data = json_of(resp)
+    assert isinstance(data.pop("id"), int)
+    data.pop("created_at"), data.pop("updated_at")
+    assert data == {"title": "t", "content": "c", "tags": []}
+
 
+@pytest.mark.parametrize("method, path", [("POST", "/notes"), ("PATCH", "/notes/{id}")])
+async def test_title_too_long_422(async_client, json_of, json_headers, db, method, path):
+    note = Note(title="ok")
+    db.add(note)
+    db.commit()
 
-def test_create_note_title_too_long():
-    client = TestClient(app)
-    long_title = "x" * 101
-    resp = client.post("/notes", json={"title": long_title})
+    url = path.format(id=note.id)
+    resp = await async_client.request(method, url, content=LONG_TITLE_BODY, headers=json_headers)
     assert resp.status_code == 422
+    assert json_of(resp).get("code") == "validation_error"
@@ -1,65 +1,31 @@
-import os
-import sys
-
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
-from sqlalchemy.pool import StaticPool
-from sqlmodel import SQLModel, create_engine
-
-# Ensure project root on path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from app.db import get_session  # noqa: E402
-from app.main import app  # noqa: E402
-
-
-@pytest.fixture(autouse=True)
-def override_db_dependency():
-    engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
-    )
-    # Import models to ensure tables are registered
-    from app import models as _models  # noqa: F401
-
-    SQLModel.metadata.create_all(engine)
-
-    def _get_session_override():
-        with Session(engine) as session:
-            yield session
-
-    app.dependency_overrides[get_session] = _get_session_override
-    yield
-    app.dependency_overrides.clear()
-
-
-def test_delete_then_get_404():
-    client = TestClient(app)
-    r = client.post("/notes", json={"title": "t", "content": "c"})
-    assert r.status_code == 201
-    note_id = r.json()["id"]
-
-    d = client.delete(f"/notes/{note_id}")
-    assert d.status_code == 204
-
-    g = client.get(f"/notes/{note_id}")
+from pydantic_core import to_json
+
+pytestmark = pytest.mark.anyio
+
+# Seed body shared by the parametrized cases, serialized once at import
+SEED_BODY = to_json({"title": "t", "content": "c"})
+
+
+@pytest.mark.parametrize(
+    "seed, deletes",
+    [
+        pytest.param(True, 1, id="existing"),
+        pytest.param(False, 1, id="nonexistent"),
+        pytest.param(True, 2, id="twice"),
+    ],
+)
+async def test_delete_is_idempotent_204(async_client, json_of, json_headers, seed, deletes):
+    note_id = 99999
+    if seed:
+        r = await async_client.post("/notes", content=SEED_BODY, headers=json_headers)
+        assert r.status_code == 201
+        note_id = json_of(r)["id"]
+
+    for _ in range(deletes):
+        d = await async_client.delete(f"/notes/{note_id}")
+        assert d.status_code == 204
+
+    g = await async_client.get(f"/notes/{note_id}")
     assert g.status_code == 404
-    assert g.json() == {"detail": "not found", "code": "not_found"}
-
-
-def test_delete_nonexistent_is_204():
-    client = TestClient(app)
-    d = client.delete("/notes/99999")
-    assert d.status_code == 204
-
-
-def test_delete_twice_both_204():
-    client = TestClient(app)
-    r = client.post("/notes", json={"title": "x"})
-    assert r.status_code == 201
-    note_id = r.json()["id"]
-
-    d1 = client.delete(f"/notes/{note_id}")
-    assert d1.status_code == 204
-    d2 = client.delete(f"/notes/{note_id}")
-    assert d2.status_code == 204
+    assert json_of(g) == {"detail": "not found", "code": "not_found"}
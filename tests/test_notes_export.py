@@ -0,0 +1,55 @@
+import pytest
+from pydantic_core import from_json
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_export_streams_jsonl_newest_first(async_client):
+    for title in ["a", "b"]:
+        assert (await async_client.post("/notes", json={"title": title, "tags": ["x"]})).status_code == 201
+
+    resp = await async_client.get("/notes/export")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [from_json(line) for line in resp.text.splitlines()]
+    assert [line["title"] for line in lines] == ["b", "a"]
+    assert set(lines[0]) == {"id", "title", "content", "tags", "created_at", "updated_at"}
+
+
+async def test_export_round_trips_through_import(async_client, json_of):
+    assert (await async_client.post("/notes", json={"title": "é", "content": "c", "tags": ["t"]})).status_code == 201
+    exported = (await async_client.get("/notes/export")).content
+
+    for note in json_of(await async_client.get("/notes"))["items"]:
+        await async_client.delete(f"/notes/{note['id']}")
+    resp = await async_client.post("/notes/import", content=exported)
+    assert resp.status_code == 200
+    assert json_of(resp) == {"inserted": 1}
+
+    items = json_of(await async_client.get("/notes"))["items"]
+    assert [(i["title"], i["content"], i["tags"]) for i in items] == [("é", "c", ["t"])]
+
+
+async def test_export_flushes_in_chunks(async_client, monkeypatch):
+    from app import routes
+
+    monkeypatch.setattr(routes, "_EXPORT_CHUNK_BYTES", 1)
+    for title in ["a", "b", "c"]:
+        assert (await async_client.post("/notes", json={"title": title})).status_code == 201
+
+    resp = await async_client.get("/notes/export")
+    assert resp.status_code == 200
+    assert [from_json(line)["title"] for line in resp.text.splitlines()] == ["c", "b", "a"]
+
+
+async def test_export_timestamps_match_api_format(async_client, json_of):
+    line = b'{"title": "old", "created_at": "2024-01-01T12:30:00.5"}\n'
+    assert (await async_client.post("/notes/import", content=line)).status_code == 200
+    assert (await async_client.post("/notes", json={"title": "new"})).status_code == 201
+
+    exported = [from_json(line) for line in (await async_client.get("/notes/export")).text.splitlines()]
+    listed = json_of(await async_client.get("/notes"))["items"]
+    assert [(e["created_at"], e["updated_at"]) for e in exported] == [
+        (item["created_at"], item["updated_at"]) for item in listed
+    ]
+    assert exported[-1]["created_at"] == "2024-01-01T12:30:00.500000"
@@ -0,0 +1,77 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_import_inserts_rows_and_skips_comments(async_client, json_of):
+    body = (
+        b'{"title": "a", "content": "1", "tags": ["x"]}\n'
+        b"# comment\n"
+        b"\n"
+        b'{"title": "b", "created_at": "2024-01-01T00:00:00Z"}\n'
+    )
+    resp = await async_client.post("/notes/import", content=body)
+    assert resp.status_code == 200
+    assert json_of(resp) == {"inserted": 2}
+
+    items = json_of(await async_client.get("/notes"))["items"]
+    assert sorted(i["title"] for i in items) == ["a", "b"]
+    b = next(i for i in items if i["title"] == "b")
+    assert b["created_at"].startswith("2024-01-01T00:00:00")
+    assert b["updated_at"] == b["created_at"]
+
+
+@pytest.mark.parametrize(
+    "stamp, expected",
+    [
+        ("2024-01-01", "2024-01-01T00:00:00"),
+        ("20240101T100000", "2024-01-01T10:00:00"),
+    ],
+)
+async def test_import_accepts_isoformat_timestamps(async_client, json_of, stamp, expected):
+    line = b'{"title": "t", "created_at": "%s"}' % stamp.encode()
+    resp = await async_client.post("/notes/import", content=line)
+    assert resp.status_code == 200
+
+    [item] = json_of(await async_client.get("/notes"))["items"]
+    assert item["created_at"].startswith(expected)
+
+
+async def test_import_invalid_line_inserts_nothing(async_client, json_of):
+    body = b'{"title": "ok"}\n{"title": ""}\n'
+    resp = await async_client.post("/notes/import", content=body)
+    assert resp.status_code == 400
+    assert json_of(resp)["detail"] == "invalid title on line 2"
+
+    assert json_of(await async_client.get("/notes"))["items"] == []
+
+
+async def test_import_reports_malformed_json_line(async_client, json_of):
+    resp = await async_client.post("/notes/import", content=b'{"title": "ok"}\n{"title": \n')
+    assert resp.status_code == 400
+    assert json_of(resp)["detail"] == "invalid JSON on line 2"
+
+
+@pytest.mark.readonly
+@pytest.mark.parametrize(
+    "line, detail",
+    [
+        (b'{"title": 5}', "invalid title on line 1"),
+        (b'{"title": "t", "content": null}', "invalid content on line 1"),
+        (b'{"title": "t", "tags": ["ok", 1]}', "invalid tags on line 1"),
+        (b'{"title": "t", "created_at": "yesterday"}', "invalid created_at on line 1"),
+        (b'["not", "an", "object"]', "invalid JSON on line 1"),
+    ],
+)
+async def test_import_rejects_invalid_fields(async_client, json_of, line, detail):
+    resp = await async_client.post("/notes/import", content=line)
+    assert resp.status_code == 400
+    assert json_of(resp)["detail"] == detail
+
+
+@pytest.mark.readonly
+async def test_import_rejects_too_many_lines(async_client, json_of):
+    resp = await async_client.post("/notes/import", content=b'{"title": "t"}\n' * 10_001)
+    assert resp.status_code == 400
+    assert json_of(resp)["detail"] == "too many lines (max 10000)"
+    assert json_of(await async_client.get("/notes"))["items"] == []
@@ -1,63 +1,87 @@
-import os
-import sys
-import time
+from datetime import datetime, timedelta, timezone
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
-from sqlalchemy.pool import StaticPool
-from sqlmodel import SQLModel, create_engine
+from sqlalchemy import event
 
-# Ensure project root on path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.models import Note
 
-from app.db import get_session  # noqa: E402
-from app.main import app  # noqa: E402
+pytestmark = pytest.mark.anyio
 
 
-@pytest.fixture(autouse=True)
-def override_db_dependency():
-    engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+async def test_list_notes_sorted_by_created_desc(async_client, json_of, db):
+    # Seed directly in one commit; ids run opposite to created_at for "a", so
+    # the order below can only come from created_at
+    t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    db.add_all(
+        [
+            Note(title="b", content="2", created_at=t0 + timedelta(minutes=1)),
+            Note(title="c", content="3", created_at=t0 + timedelta(minutes=2)),
+            Note(title="a", content="1", created_at=t0),
+        ]
     )
-    # Import models to ensure tables are registered
-    from app import models as _models  # noqa: F401
-
-    SQLModel.metadata.create_all(engine)
-
-    def _get_session_override():
-        with Session(engine) as session:
-            yield session
-
-    app.dependency_overrides[get_session] = _get_session_override
-    yield
-    app.dependency_overrides.clear()
-
-
-def test_list_notes_sorted_by_created_desc():
-    client = TestClient(app)
-
-    # Seed three notes via POST /notes
-    r1 = client.post("/notes", json={"title": "a", "content": "1"})
-    assert r1.status_code == 201
-    # Small sleep to ensure distinct timestamps ordering
-    time.sleep(0.01)
-    r2 = client.post("/notes", json={"title": "b", "content": "2"})
-    assert r2.status_code == 201
-    time.sleep(0.01)
-    r3 = client.post("/notes", json={"title": "c", "content": "3"})
-    assert r3.status_code == 201
+    db.commit()
 
     # GET /notes
-    resp = client.get("/notes")
+    resp = await async_client.get("/notes")
     assert resp.status_code == 200
-    data = resp.json()
+    data = json_of(resp)
     assert isinstance(data, dict)
     items = data.get("items")
     assert isinstance(items, list)
     assert len(items) == 3
 
-    # Expect newest-first (created_at desc): r3, r2, r1
+    # Expect newest-first (created_at desc)
     titles = [item["title"] for item in items]
     assert titles == ["c", "b", "a"]
 
+
+async def test_list_notes_keyset_pagination(async_client, json_of):
+    for title in ["a", "b", "c", "d", "e"]:
+        assert (await async_client.post("/notes", json={"title": title})).status_code == 201
+
+    seen: list[str] = []
+    after = None
+    pages = 0
+    while True:
+        params = {"limit": 2} if after is None else {"limit": 2, "after": after}
+        resp = await async_client.get("/notes", params=params)
+        assert resp.status_code == 200
+        data = json_of(resp)
+        assert len(data["items"]) <= 2
+        seen.extend(item["title"] for item in data["items"])
+        pages += 1
+        after = data["next_after"]
+        if after is None:
+            break
+
+    assert pages == 3
+    assert seen == ["e", "d", "c", "b", "a"]
+
+
+@pytest.mark.readonly
+async def test_list_notes_limit_out_of_range_422(async_client, json_of):
+    resp = await async_client.get("/notes", params={"limit": 0})
+    assert resp.status_code == 422
+    assert json_of(resp).get("code") == "validation_error"
+
+
+async def test_list_notes_emits_single_query(async_client, json_of, engine):
+    for title in ["a", "b", "c"]:
+        assert (await async_client.post("/notes", json={"title": title})).status_code == 201
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        resp = await async_client.get("/notes")
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert resp.status_code == 200
+    assert len(json_of(resp)["items"]) == 3
+    # Ignore the per-request SAVEPOINT bookkeeping from the db_override fixture
+    queries = [s for s in statements if not s.startswith(("SAVEPOINT", "RELEASE", "ROLLBACK"))]
+    assert len(queries) == 1, statements